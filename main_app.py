@@ -986,7 +986,11 @@ class WellProductionApp(QMainWindow):
             
             # Save monthly well type data
             if 'monthly_types' in results and not results['monthly_types'].empty:
-                success = self.operations_db.save_well_monthly_type(operation_id, results['monthly_types'])
+                monthly_types = results['monthly_types']
+                success = self.operations_db.save_well_monthly_type(
+                    operation_id, monthly_types,
+                    fast_path=len(monthly_types) >= self.operations_db.FAST_PATH_MIN_ROWS
+                )
                 if not success:
                     QMessageBox.warning(
                         self,
@@ -1004,7 +1008,11 @@ class WellProductionApp(QMainWindow):
             
             # Save completion status data if available
             if 'completion_status' in results and not results['completion_status'].empty:
-                success = self.operations_db.save_completion_status(operation_id, results['completion_status'])
+                completion_status = results['completion_status']
+                success = self.operations_db.save_completion_status(
+                    operation_id, completion_status,
+                    fast_path=len(completion_status) >= self.operations_db.FAST_PATH_MIN_ROWS
+                )
                 if not success:
                     QMessageBox.warning(
                         self,
@@ -1,5 +1,7 @@
 import os
 import sqlite3
+from itertools import islice, repeat
+import numpy as np
 import pandas as pd
 from datetime import datetime
 
@@ -9,11 +11,53 @@ class OperationsDatabase:
     for the Well Production Application. Includes tracking of completion status by reservoir.
     """
     
+    # UPSERT (INSERT ... ON CONFLICT DO UPDATE) requires SQLite 3.24+
+    _HAS_UPSERT = sqlite3.sqlite_version_info >= (3, 24, 0)
+    # Bound parameter limit per statement on older SQLite builds (used by fast_path)
+    _MAX_SQL_VARIABLES = 999
+    # Frame size from which fast_path (multi-row VALUES) is worth using
+    FAST_PATH_MIN_ROWS = 20000
+    
+    # Insert columns (in statement order) and unique keys of the results tables
+    _MONTHLY_TYPE_COLUMNS = ('operation_id', 'well_name', 'year', 'month', 'well_type',
+                             'oil_rate', 'water_rate', 'water_inj_rate')
+    _MONTHLY_TYPE_KEY = ('operation_id', 'well_name', 'year', 'month')
+    _COMPLETION_STATUS_COLUMNS = ('operation_id', 'well_name', 'completion_name', 'reservoir',
+                                  'year', 'month', 'is_active', 'well_type',
+                                  'oil_rate', 'water_rate', 'water_inj_rate')
+    _COMPLETION_STATUS_KEY = ('operation_id', 'well_name', 'completion_name', 'reservoir',
+                              'year', 'month')
+    
+    # Fill values for missing columns / missing values in the results tables
+    _MONTHLY_TYPE_DEFAULTS = {'oil_rate': 0.0, 'water_rate': 0.0, 'water_inj_rate': 0.0}
+    _COMPLETION_STATUS_DEFAULTS = {'completion_name': 'UNKNOWN', 'reservoir': 'UNKNOWN',
+                                   'is_active': 0, 'well_type': 'UNKNOWN',
+                                   'oil_rate': 0.0, 'water_rate': 0.0, 'water_inj_rate': 0.0}
+    
+    # Storage dtypes of the numeric columns of the results tables
+    _MONTHLY_TYPE_DTYPES = {'year': np.int64, 'month': np.int64, 'oil_rate': np.float64,
+                            'water_rate': np.float64, 'water_inj_rate': np.float64}
+    _COMPLETION_STATUS_DTYPES = {'year': np.int64, 'month': np.int64, 'is_active': np.int8,
+                                 'oil_rate': np.float64, 'water_rate': np.float64,
+                                 'water_inj_rate': np.float64}
+    
+    # INSERT statements built once and shared by every instance. Reusing the same
+    # SQL string also lets sqlite3's statement cache skip re-parsing it.
+    _upsert_queries = {}
+    
     def __init__(self, db_path=None):
         """Initialize database connection"""
         self.db_path = db_path or os.path.join(os.getcwd(), "Data", "operations_results.db")
         self.connection = None
         self.cursor = None
+        # Cache of operation_name -> latest operation_id (None if not found)
+        self._op_id_cache = {}
+        # Whether child tables delete their rows through ON DELETE CASCADE
+        self._has_cascade = False
+        # Tables whose planner statistics were refreshed during this session
+        self._analyzed_tables = set()
+        # Column list of the operations table, read once when the schema is created
+        self._operations_columns = []
         
     def connect(self):
         """Establish connection to the SQLite database"""
@@ -27,6 +71,9 @@ class OperationsDatabase:
             self.connection = sqlite3.connect(self.db_path)
             self.cursor = self.connection.cursor()
             
+            # Foreign keys are off by default in SQLite and must be enabled per connection
+            self.cursor.execute("PRAGMA foreign_keys = ON")
+            
             # Create necessary tables if they don't exist
             self._create_tables()
             
@@ -38,9 +85,16 @@ class OperationsDatabase:
     def disconnect(self):
         """Close database connection"""
         if self.connection:
+            try:
+                # Let SQLite refresh any planner statistics that went stale
+                self.connection.execute("PRAGMA optimize")
+            except sqlite3.Error as e:
+                print(f"Error optimizing database: {e}")
             self.connection.close()
             self.connection = None
             self.cursor = None
+            self._op_id_cache.clear()
+            self._analyzed_tables.clear()
     
     def _create_tables(self):
         """Create necessary tables if they don't exist"""
@@ -69,7 +123,8 @@ class OperationsDatabase:
                 oil_rate REAL,
                 water_rate REAL,
                 water_inj_rate REAL,
-                UNIQUE (operation_id, well_name, year, month)
+                UNIQUE (operation_id, well_name, year, month),
+                FOREIGN KEY (operation_id) REFERENCES operations (operation_id) ON DELETE CASCADE
             )
             ''')
             
@@ -88,11 +143,39 @@ class OperationsDatabase:
                 oil_rate REAL,
                 water_rate REAL,
                 water_inj_rate REAL,
-                UNIQUE (operation_id, well_name, completion_name, reservoir, year, month)
+                UNIQUE (operation_id, well_name, completion_name, reservoir, year, month),
+                FOREIGN KEY (operation_id) REFERENCES operations (operation_id) ON DELETE CASCADE
             )
             ''')
-            
+
+            # Indexes for the read queries. The UNIQUE constraints already index
+            # (operation_id, well_name, ..., year, month), which serves lookups by
+            # operation in ORDER BY order; these cover the remaining filters.
+            self.cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_wmt_well
+                ON well_monthly_type (well_name, year, month)
+            ''')
+            self.cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_wcs_well
+                ON well_completion_status (well_name, completion_name, reservoir, year, month)
+            ''')
+            self.cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_wcs_op_date
+                ON well_completion_status (operation_id, year, month)
+            ''')
+
             self.connection.commit()
+            
+            # Databases created before the foreign keys were added keep their old
+            # schema, so delete_operation still has to clear their child rows
+            self._has_cascade = all(
+                self._has_operation_cascade(table)
+                for table in ('well_monthly_type', 'well_completion_status')
+            )
+            
+            # Cache the operations columns so get_operations can select them explicitly
+            self.cursor.execute("PRAGMA table_info(operations)")
+            self._operations_columns = [info[1] for info in self.cursor.fetchall()]
             return True
         
         except Exception as e:
@@ -100,12 +183,30 @@ class OperationsDatabase:
             self.connection.rollback()
             return False
     
+    def _lookup_operation_id(self, operation_name):
+        """Return the latest operation ID for a name, using the in-memory cache"""
+        if operation_name in self._op_id_cache:
+            return self._op_id_cache[operation_name]
+        
+        query = """
+        SELECT operation_id FROM operations 
+        WHERE operation_name = ? 
+        ORDER BY creation_date DESC LIMIT 1
+        """
+        self.cursor.execute(query, (operation_name,))
+        result = self.cursor.fetchone()
+        operation_id = result[0] if result else None
+        self._op_id_cache[operation_name] = operation_id
+        return operation_id
+    
+    def _invalidate_operation_cache(self, operation_id):
+        """Drop cached names that resolve to the given operation ID"""
+        for name in [name for name, op_id in self._op_id_cache.items() if op_id == operation_id]:
+            del self._op_id_cache[name]
+    
     def operation_exists(self, operation_name):
         """Check if an operation with the given name exists"""
-        query = "SELECT COUNT(*) FROM operations WHERE operation_name = ?"
-        self.cursor.execute(query, (operation_name,))
-        count = self.cursor.fetchone()[0]
-        return count > 0
+        return self._lookup_operation_id(operation_name) is not None
     
     def create_operation(self, operation_name, description=None, parameters=None):
         """
@@ -124,6 +225,7 @@ class OperationsDatabase:
                 print(f"Operación anterior '{operation_name}' eliminada (ID: {old_operation_id})")
                 
             # Create the new operation
+            self._op_id_cache.pop(operation_name, None)
             query = "INSERT INTO operations (operation_name, description, parameters) VALUES (?, ?, ?)"
             self.cursor.execute(query, (operation_name, description, parameters))
             self.connection.commit()
@@ -136,66 +238,169 @@ class OperationsDatabase:
             self.connection.rollback()
             return None
     
-    def save_well_monthly_type(self, operation_id, df):
+    def _has_operation_cascade(self, table):
+        """Check if a table's operation_id references operations with ON DELETE CASCADE"""
+        self.cursor.execute(f"PRAGMA foreign_key_list({table})")
+        # Columns: id, seq, table, from, to, on_update, on_delete, match
+        return any(
+            fk[2] == 'operations' and fk[3] == 'operation_id' and fk[6].upper() == 'CASCADE'
+            for fk in self.cursor.fetchall()
+        )
+    
+    @staticmethod
+    def _conform_columns(df, required_columns, defaults):
+        """
+        Return a new frame with exactly required_columns (in that order), with
+        missing columns and missing values filled from defaults in one pass
+        """
+        missing = [col for col in required_columns if col not in df.columns]
+        if missing:
+            print(f"Missing required columns: {', '.join(missing)}")
+        
+        df = df.reindex(columns=required_columns)
+        df.fillna(defaults, inplace=True)
+        return df
+    
+    @staticmethod
+    def _drop_missing_well_names(df):
+        """Filter out rows with a None/NaN well_name (no copy when there are none)"""
+        missing = df['well_name'].isna()
+        return df.loc[~missing] if missing.any() else df
+    
+    @staticmethod
+    def _ensure_dtype(df, col, dtype):
+        """Cast a column in place only when its dtype differs from the expected one"""
+        if df[col].dtype != dtype:
+            df[col] = df[col].astype(dtype)
+    
+    @classmethod
+    def _build_upsert_query(cls, table, columns, key_columns, rows_per_statement=1):
+        """
+        Build the batch insert statement for a results table. Rows that already
+        exist (same key_columns) are updated in place instead of deleted and
+        re-inserted; older SQLite versions fall back to INSERT OR REPLACE.
+        rows_per_statement > 1 builds a multi-row VALUES list.
+        """
+        cache_key = (table, tuple(columns), tuple(key_columns), rows_per_statement)
+        query = cls._upsert_queries.get(cache_key)
+        if query is not None:
+            return query
+        
+        column_list = ", ".join(columns)
+        row_placeholder = "(" + ", ".join("?" for _ in columns) + ")"
+        placeholders = ", ".join(row_placeholder for _ in range(rows_per_statement))
+        
+        if not cls._HAS_UPSERT:
+            query = f"INSERT OR REPLACE INTO {table} ({column_list}) VALUES {placeholders}"
+        else:
+            updates = ", ".join(f"{col} = excluded.{col}" for col in columns if col not in key_columns)
+            query = (
+                f"INSERT INTO {table} ({column_list}) VALUES {placeholders} "
+                f"ON CONFLICT ({', '.join(key_columns)}) DO UPDATE SET {updates}"
+            )
+        
+        cls._upsert_queries[cache_key] = query
+        return query
+    
+    def _analyze_once(self, table):
+        """Gather planner statistics for a table after its first bulk load this session"""
+        if table in self._analyzed_tables:
+            return
+        try:
+            self.cursor.execute(f"ANALYZE {table}")
+            self.connection.commit()
+            self._analyzed_tables.add(table)
+        except sqlite3.Error as e:
+            print(f"Error analyzing table {table}: {e}")
+    
+    @staticmethod
+    def _iter_rows(operation_id, df):
+        """
+        Lazily yield insert parameter tuples (operation_id first) from a frame whose
+        columns are already in insert order. Columns are converted with tolist() so
+        values are native Python types, but no list of row tuples is built.
+        """
+        return zip(repeat(operation_id), *(df[col].tolist() for col in df.columns))
+    
+    def _write_rows(self, table, columns, key_columns, rows, fast_path=False):
+        """
+        Write parameter tuples to a results table
+        
+        rows: Iterable of parameter tuples (consumed lazily)
+        fast_path: Bind many rows per statement (multi-row VALUES) instead of
+                   one statement execution per row. Roughly halves insert time
+                   on large frames.
+        """
+        if not fast_path:
+            # executemany consumes the iterator directly, no chunk lists needed
+            insert_query = self._build_upsert_query(table, columns, key_columns)
+            self.cursor.executemany(insert_query, rows)
+            return
+        
+        # As many rows per statement as the parameter limit allows
+        rows_per_statement = max(1, self._MAX_SQL_VARIABLES // len(columns))
+        multi_query = self._build_upsert_query(table, columns, key_columns, rows_per_statement)
+        rows = iter(rows)
+        tail = []
+        
+        def full_statements():
+            while True:
+                batch = list(islice(rows, rows_per_statement))
+                if len(batch) < rows_per_statement:
+                    # Keep the remaining rows that don't fill a whole statement
+                    tail.extend(batch)
+                    return
+                yield [value for row in batch for value in row]
+        
+        self.cursor.executemany(multi_query, full_statements())
+        
+        if tail:
+            tail_query = self._build_upsert_query(table, columns, key_columns, len(tail))
+            self.cursor.execute(tail_query, [value for row in tail for value in row])
+    
+    def _bulk_upsert(self, table, columns, key_columns, defaults, dtypes, operation_id, df, fast_path=False):
+        """
+        Conform a results frame to its table layout and upsert its rows without
+        touching the transaction state. The caller is responsible for BEGIN/COMMIT/ROLLBACK.
+        """
+        # Check if dataframe is empty
+        if df.empty:
+            print(f"Warning: Empty dataframe for {table}")
+            return
+        
+        # Ensure DataFrame has the expected columns (in insert order) and fill gaps
+        required_columns = list(columns[1:])
+        df = self._conform_columns(df, required_columns, defaults)
+        
+        # Ensure all values are of the expected type
+        for col, dtype in dtypes.items():
+            self._ensure_dtype(df, col, dtype)
+        
+        # Filter out rows with None/NaN well_name
+        df = self._drop_missing_well_names(df)
+        
+        # Stream parameter tuples (columns ordered to match the INSERT statement)
+        self._write_rows(table, columns, key_columns, self._iter_rows(operation_id, df), fast_path)
+    
+    def save_well_monthly_type(self, operation_id, df, fast_path=False):
         """
         Save well monthly type classification data
         
         operation_id: ID of the operation
         df: DataFrame with columns well_name, year, month, well_type, 
             oil_rate, water_rate, water_inj_rate
+        fast_path: Use multi-row INSERT statements (faster for large frames)
         """
         try:
-            # Check if dataframe is empty
-            if df.empty:
-                print("Warning: Empty dataframe for well_monthly_type")
-                return True
-            
-            # Ensure DataFrame has the expected columns
-            required_columns = ['well_name', 'year', 'month', 'well_type', 'oil_rate', 'water_rate', 'water_inj_rate']
-            for col in required_columns:
-                if col not in df.columns:
-                    print(f"Missing required column: {col}")
-                    df[col] = 0.0 if col in ['oil_rate', 'water_rate', 'water_inj_rate'] else None
-            
-            # Ensure all values are of the expected type
-            df = df.copy()
-            df['year'] = df['year'].astype(int)
-            df['month'] = df['month'].astype(int)
-            df['oil_rate'] = df['oil_rate'].astype(float)
-            df['water_rate'] = df['water_rate'].astype(float)
-            df['water_inj_rate'] = df['water_inj_rate'].astype(float)
-            
-            # Filter out rows with None/NaN well_name
-            df = df[df['well_name'].notna()]
-            
-            # Prepare batch insert statement
-            insert_query = """
-            INSERT OR REPLACE INTO well_monthly_type 
-                (operation_id, well_name, year, month, well_type, oil_rate, water_rate, water_inj_rate)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """
-            
-            # Convert DataFrame to list of tuples for batch insert
-            rows = []
-            for _, row in df.iterrows():
-                rows.append((
-                    operation_id,
-                    row['well_name'],
-                    int(row['year']),
-                    int(row['month']),
-                    row['well_type'],
-                    float(row['oil_rate']),
-                    float(row['water_rate']),
-                    float(row['water_inj_rate'])
-                ))
+            # Insert all rows inside a single transaction
+            self.connection.execute("BEGIN TRANSACTION")
+            self._bulk_upsert('well_monthly_type', self._MONTHLY_TYPE_COLUMNS, self._MONTHLY_TYPE_KEY,
+                              self._MONTHLY_TYPE_DEFAULTS, self._MONTHLY_TYPE_DTYPES,
+                              operation_id, df, fast_path)
             
-            # Execute batch insert in smaller chunks
-            chunk_size = 500
-            for i in range(0, len(rows), chunk_size):
-                chunk = rows[i:i + chunk_size]
-                self.cursor.executemany(insert_query, chunk)
-                self.connection.commit()  # Commit after each chunk
-                
+            # Commit once at the end
+            self.connection.commit()
+            self._analyze_once('well_monthly_type')
             return True
         
         except Exception as e:
@@ -203,78 +408,25 @@ class OperationsDatabase:
             self.connection.rollback()
             return False
     
-    def save_completion_status(self, operation_id, df):
+    def save_completion_status(self, operation_id, df, fast_path=False):
         """
         Save well completion status by reservoir
         
         operation_id: ID of the operation
         df: DataFrame with columns well_name, completion_name, reservoir, year, month,
             is_active, well_type, oil_rate, water_rate, water_inj_rate
+        fast_path: Use multi-row INSERT statements (faster for large frames)
         """
         try:
-            # Check if dataframe is empty
-            if df.empty:
-                print("Warning: Empty dataframe for well_completion_status")
-                return True
-            
-            # Ensure DataFrame has the expected columns
-            required_columns = ['well_name', 'completion_name', 'reservoir', 'year', 'month',
-                              'is_active', 'well_type', 'oil_rate', 'water_rate', 'water_inj_rate']
-                              
-            for col in required_columns:
-                if col not in df.columns:
-                    print(f"Missing required column: {col}")
-                    if col in ['oil_rate', 'water_rate', 'water_inj_rate']:
-                        df[col] = 0.0
-                    elif col == 'is_active':
-                        df[col] = 0
-                    else:
-                        df[col] = 'UNKNOWN'
-            
-            # Ensure all values are of the expected type
-            df = df.copy()
-            df['year'] = df['year'].astype(int)
-            df['month'] = df['month'].astype(int)
-            df['is_active'] = df['is_active'].astype(int)
-            df['oil_rate'] = df['oil_rate'].astype(float)
-            df['water_rate'] = df['water_rate'].astype(float)
-            df['water_inj_rate'] = df['water_inj_rate'].astype(float)
-            
-            # Filter out rows with None/NaN well_name
-            df = df[df['well_name'].notna()]
-            
-            # Prepare batch insert statement
-            insert_query = """
-            INSERT OR REPLACE INTO well_completion_status 
-                (operation_id, well_name, completion_name, reservoir, year, month,
-                is_active, well_type, oil_rate, water_rate, water_inj_rate)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """
-            
-            # Convert DataFrame to list of tuples for batch insert
-            rows = []
-            for _, row in df.iterrows():
-                rows.append((
-                    operation_id,
-                    row['well_name'],
-                    row['completion_name'],
-                    row['reservoir'],
-                    int(row['year']),
-                    int(row['month']),
-                    int(row['is_active']),
-                    row['well_type'],
-                    float(row['oil_rate']),
-                    float(row['water_rate']),
-                    float(row['water_inj_rate'])
-                ))
+            # Insert all rows inside a single transaction
+            self.connection.execute("BEGIN TRANSACTION")
+            self._bulk_upsert('well_completion_status', self._COMPLETION_STATUS_COLUMNS,
+                              self._COMPLETION_STATUS_KEY, self._COMPLETION_STATUS_DEFAULTS,
+                              self._COMPLETION_STATUS_DTYPES, operation_id, df, fast_path)
             
-            # Execute batch insert in smaller chunks
-            chunk_size = 500
-            for i in range(0, len(rows), chunk_size):
-                chunk = rows[i:i + chunk_size]
-                self.cursor.executemany(insert_query, chunk)
-                self.connection.commit()  # Commit after each chunk
-                
+            # Commit once at the end
+            self.connection.commit()
+            self._analyze_once('well_completion_status')
             return True
         
         except Exception as e:
@@ -282,14 +434,16 @@ class OperationsDatabase:
             self.connection.rollback()
             return False
     
-    def get_well_monthly_type(self, operation_id=None, well_name=None):
+    def get_well_monthly_type(self, operation_id=None, well_name=None, chunksize=None):
         """
         Get well monthly type classification data
         
         operation_id: Optional ID of the operation to filter by
         well_name: Optional name of the well to filter by
+        chunksize: Optional number of rows per chunk to bound memory use
         
-        Returns: DataFrame with the requested data
+        Returns: DataFrame with the requested data, or an iterator of
+                 DataFrames when chunksize is given
         """
         query = "SELECT * FROM well_monthly_type WHERE 1=1"
         params = []
@@ -306,24 +460,21 @@ class OperationsDatabase:
             # Add order by clause
             query += " ORDER BY well_name, year, month"
             
-            self.cursor.execute(query, params)
-            columns = [description[0] for description in self.cursor.description]
-            data = self.cursor.fetchall()
+            # Stream the result set in chunks when requested
+            if chunksize is not None:
+                return pd.read_sql_query(query, self.connection, params=params, chunksize=chunksize)
             
-            # Convert to DataFrame
-            df = pd.DataFrame(data, columns=columns)
+            # Read straight into a DataFrame (keeps column names on empty results)
+            df = pd.read_sql_query(query, self.connection, params=params)
             
-            # Handle empty results
-            if df.empty:
-                return pd.DataFrame(columns=columns)
-                
             return df
         
         except Exception as e:
             print(f"Error getting well monthly type data: {e}")
-            return pd.DataFrame()
+            return iter([]) if chunksize is not None else pd.DataFrame()
     
-    def get_completion_status(self, operation_id=None, well_name=None, reservoir=None, date=None):
+    def get_completion_status(self, operation_id=None, well_name=None, reservoir=None, date=None,
+                              chunksize=None):
         """
         Get well completion status by reservoir
         
@@ -331,8 +482,10 @@ class OperationsDatabase:
         well_name: Optional name of the well to filter by
         reservoir: Optional reservoir to filter by
         date: Optional date to filter by (tuple of year, month)
+        chunksize: Optional number of rows per chunk to bound memory use
         
-        Returns: DataFrame with the requested data
+        Returns: DataFrame with the requested data, or an iterator of
+                 DataFrames when chunksize is given
         """
         query = "SELECT * FROM well_completion_status WHERE 1=1"
         params = []
@@ -359,36 +512,39 @@ class OperationsDatabase:
             # Add order by clause
             query += " ORDER BY well_name, completion_name, reservoir, year, month"
             
-            self.cursor.execute(query, params)
-            columns = [description[0] for description in self.cursor.description]
-            data = self.cursor.fetchall()
+            # Stream the result set in chunks when requested
+            if chunksize is not None:
+                chunks = pd.read_sql_query(query, self.connection, params=params, chunksize=chunksize)
+                return (self._completion_status_types(chunk) for chunk in chunks)
             
-            # Convert to DataFrame
-            df = pd.DataFrame(data, columns=columns)
+            # Read straight into a DataFrame (keeps column names on empty results)
+            df = pd.read_sql_query(query, self.connection, params=params)
             
-            # Handle empty results
-            if df.empty:
-                return pd.DataFrame(columns=columns)
-                
-            # Convert is_active to boolean for easier use
-            if 'is_active' in df.columns:
-                df['is_active'] = df['is_active'].astype(bool)
-                
-            return df
+            return self._completion_status_types(df)
         
         except Exception as e:
             print(f"Error getting well completion status data: {e}")
-            return pd.DataFrame()
+            return iter([]) if chunksize is not None else pd.DataFrame()
+    
+    @staticmethod
+    def _completion_status_types(df):
+        """Convert is_active to boolean for easier use"""
+        if 'is_active' in df.columns:
+            df['is_active'] = df['is_active'].astype(bool)
+        return df
     
     def get_operations(self):
         """Get list of all operations"""
-        query = "SELECT * FROM operations ORDER BY creation_date DESC"
         try:
+            # Select the columns cached at schema time, or all of them if that step didn't run
+            columns = self._operations_columns
+            query = f"SELECT {', '.join(columns) or '*'} FROM operations ORDER BY creation_date DESC"
             self.cursor.execute(query)
-            columns = [description[0] for description in self.cursor.description]
             data = self.cursor.fetchall()
             
-            # Convert to DataFrame
+            # Convert to DataFrame (names come from the cursor only without a cached list)
+            if not columns:
+                columns = [desc[0] for desc in self.cursor.description]
             df = pd.DataFrame(data, columns=columns)
             return df
         
@@ -398,15 +554,8 @@ class OperationsDatabase:
     
     def get_latest_operation_id(self, operation_name):
         """Get the ID of the latest operation with the given name"""
-        query = """
-        SELECT operation_id FROM operations 
-        WHERE operation_name = ? 
-        ORDER BY creation_date DESC LIMIT 1
-        """
         try:
-            self.cursor.execute(query, (operation_name,))
-            result = self.cursor.fetchone()
-            return result[0] if result else None
+            return self._lookup_operation_id(operation_name)
         
         except Exception as e:
             print(f"Error getting latest operation ID: {e}")
@@ -418,17 +567,17 @@ class OperationsDatabase:
             # Begin transaction
             self.connection.execute("BEGIN TRANSACTION")
             
-            # Delete from well_monthly_type
-            self.cursor.execute("DELETE FROM well_monthly_type WHERE operation_id = ?", (operation_id,))
-            
-            # Delete from well_completion_status
-            self.cursor.execute("DELETE FROM well_completion_status WHERE operation_id = ?", (operation_id,))
+            if not self._has_cascade:
+                # Older schema without foreign keys: delete related rows explicitly
+                self.cursor.execute("DELETE FROM well_monthly_type WHERE operation_id = ?", (operation_id,))
+                self.cursor.execute("DELETE FROM well_completion_status WHERE operation_id = ?", (operation_id,))
             
-            # Delete from operations
+            # Delete from operations (related rows follow through ON DELETE CASCADE)
             self.cursor.execute("DELETE FROM operations WHERE operation_id = ?", (operation_id,))
             
             # Commit transaction
             self.connection.commit()
+            self._invalidate_operation_cache(operation_id)
             print(f"Operación ID: {operation_id} eliminada exitosamente")
             return True
             
@@ -15,6 +15,16 @@ class WellTypeCalculator:
        it remains an injector until production data appears.
     """
     
+    # Possible monthly well types
+    _WELL_TYPES = ['UNKNOWN', 'DUAL', 'PRODUCTION', 'INJECTION']
+    # Codes of the well types in _WELL_TYPES
+    _UNKNOWN = _WELL_TYPES.index('UNKNOWN')
+    _DUAL = _WELL_TYPES.index('DUAL')
+    _PRODUCTION = _WELL_TYPES.index('PRODUCTION')
+    _INJECTION = _WELL_TYPES.index('INJECTION')
+    # Days per month of a non-leap year
+    _DAYS_IN_MONTH = np.array([31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31])
+    
     def __init__(self, data_store):
         """
         Initialize with a reference to the data store
@@ -29,11 +39,49 @@ class WellTypeCalculator:
         
     def _build_completion_to_well_map(self):
         """Build completion to well mapping once for reuse"""
-        completion_to_well = {}
-        for well_name, completions in self.data_store.well_to_completions.items():
-            for completion in completions:
-                completion_to_well[completion] = well_name
-        return completion_to_well
+        return {
+            completion: well_name
+            for well_name, completions in self.data_store.well_to_completions.items()
+            for completion in completions
+        }
+    
+    def _well_dtype(self):
+        """
+        Build the categorical dtype of the well_name columns from the current mapping
+        (sorted categories keep code order equal to name order)
+        """
+        return pd.CategoricalDtype(sorted(set(self._completion_to_well.values())))
+    
+    def _key_dtypes(self):
+        """
+        Build the categorical dtypes shared by the well_name, completion_name and
+        reservoir columns of both completion-level frames, from the current mappings
+        """
+        return {
+            'well_name': self._well_dtype(),
+            'completion_name': pd.CategoricalDtype(sorted(self._completion_to_well)),
+            'reservoir': pd.CategoricalDtype(
+                pd.Index([*self.data_store.completion_to_reservoir.values(), 'UNKNOWN']).dropna().unique()
+            ),
+        }
+    
+    @staticmethod
+    def _map_completions(completions, mapping, default=None, dtype=None):
+        """
+        Map a completion name column through a dict, looking up each distinct
+        name once and gathering the results by categorical code
+        
+        dtype: Optional CategoricalDtype of the mapped values (returns a categorical column)
+        """
+        categorical = pd.Categorical(completions)
+        # Trailing slot catches code -1 (missing completion name)
+        values = [mapping.get(name, default) for name in categorical.categories] + [default]
+        if dtype is None:
+            return pd.Series(np.array(values, dtype=object)[categorical.codes], index=completions.index)
+        
+        # Gather category codes of the mapped values (-1 where unmapped)
+        codes = dtype.categories.get_indexer(values)
+        return pd.Series(pd.Categorical.from_codes(codes[categorical.codes], dtype=dtype), index=completions.index)
     
     def calculate_monthly_well_types(self):
         """
@@ -43,11 +91,13 @@ class WellTypeCalculator:
         Returns: DataFrame with columns well_name, year, month, well_type, 
                  oil_rate, water_rate, water_inj_rate
         """
+        well_dtype = self._well_dtype()
+        
         # Process production data
-        prod_monthly = self._process_production_data()
+        prod_monthly = self._process_production_data(well_dtype)
         
         # Process injection data
-        inj_monthly = self._process_injection_data()
+        inj_monthly = self._process_injection_data(well_dtype)
         
         # Get the historical well types (cumulative production and injection)
         historical_well_types = self._calculate_historical_well_types(prod_monthly, inj_monthly)
@@ -60,13 +110,14 @@ class WellTypeCalculator:
         # We'll keep has_dual_function=1 for easy identification
         if 'well_type' in combined.columns and not combined.empty:
             # For DUAL wells, determine dominant type
-            mask = combined['well_type'] == 'DUAL'
+            mask = (combined['well_type'] == 'DUAL').to_numpy()
             if mask.any():
-                combined.loc[mask, 'well_type'] = combined[mask].apply(
-                    lambda row: 'PRODUCTION' if (row['oil_rate'] + row['water_rate'] >= row['water_inj_rate']) 
-                                else 'INJECTION', 
-                    axis=1
-                )
+                total_prod = combined['oil_rate'].to_numpy()[mask] + combined['water_rate'].to_numpy()[mask]
+                inj = combined['water_inj_rate'].to_numpy()[mask]
+                # Swap the type codes directly; DUAL only comes from the merged (categorical) branch
+                codes = combined['well_type'].cat.codes.to_numpy().copy()
+                codes[mask] = np.where(total_prod >= inj, self._PRODUCTION, self._INJECTION)
+                combined['well_type'] = pd.Categorical.from_codes(codes, dtype=combined['well_type'].dtype)
         
         # Ensure all required columns exist
         if not combined.empty:
@@ -87,120 +138,142 @@ class WellTypeCalculator:
                     combined[col] = 0 if col in ('oil_rate', 'water_rate', 'water_inj_rate') else ''
                     
             combined = combined[result_columns]
+            
+            # Return plain strings like the other result frames
+            categorical_columns = [col for col in ('well_name', 'well_type')
+                                   if isinstance(combined[col].dtype, pd.CategoricalDtype)]
+            if categorical_columns:
+                combined = combined.astype(dict.fromkeys(categorical_columns, object))
         
         return combined
     
-    def _process_production_data(self):
+    def _process_production_data(self, well_dtype):
         """Process production data to monthly format by well"""
-        # Get production data
-        prod_data = self.data_store.production_data.data.copy()
+        # Get production data (read in place, no full-frame copy)
+        source = self.data_store.production_data.data
         
-        if prod_data.empty:
+        if source.empty:
             return pd.DataFrame(columns=['well_name', 'year', 'month', 'oil_rate', 'water_rate'])
         
-        # Add well_name column based on completion name
-        prod_data['well_name'] = prod_data['COMP_S_NAME'].map(self._completion_to_well)
+        # Map completion names to wells
+        well_name = self._map_completions(source['COMP_S_NAME'], self._completion_to_well, dtype=well_dtype)
         
         # Drop rows where well_name is null (unknown completions)
-        prod_data = prod_data[prod_data['well_name'].notna()]
-        
-        # Extract year and month
-        prod_data['year'] = prod_data['PROD_DT'].dt.year
-        prod_data['month'] = prod_data['PROD_DT'].dt.month
-        
-        # Calculate daily rates
-        days_in_month = prod_data['PROD_DT'].dt.daysinmonth
-        prod_data['oil_rate'] = prod_data['VO_OIL_PROD'] / days_in_month
-        prod_data['water_rate'] = prod_data['VO_WAT_PROD'] / days_in_month
+        known = well_name.notna()
+        source = source.loc[known, ['PROD_DT', 'VO_OIL_PROD', 'VO_WAT_PROD']]
+        
+        # Build the working frame: year, month and daily rates
+        year, month = self._year_month(source['PROD_DT'])
+        days_in_month = self._days_in_month(year, month)
+        prod_data = pd.DataFrame({
+            'well_name': well_name[known],
+            'year': year,
+            'month': month,
+            'oil_rate': source['VO_OIL_PROD'] / days_in_month,
+            'water_rate': source['VO_WAT_PROD'] / days_in_month
+        })
         
         # Group by well, year, month and sum rates
-        prod_monthly = prod_data.groupby(['well_name', 'year', 'month']).agg({
-            'oil_rate': 'sum',
-            'water_rate': 'sum'
-        }).reset_index()
+        prod_monthly = prod_data.groupby(['well_name', 'year', 'month'], sort=False, observed=True, as_index=False)[
+            ['oil_rate', 'water_rate']
+        ].sum()
         
         return prod_monthly
     
-    def _process_injection_data(self):
+    def _process_injection_data(self, well_dtype):
         """Process injection data to monthly format by well"""
-        # Get injection data
-        inj_data = self.data_store.injection_data.data.copy()
+        # Get injection data (read in place, no full-frame copy)
+        source = self.data_store.injection_data.data
         
-        if inj_data.empty:
+        if source.empty:
             return pd.DataFrame(columns=['well_name', 'year', 'month', 'water_inj_rate'])
         
-        # Add well_name column based on completion name
-        inj_data['well_name'] = inj_data['COMPLETION_LEGAL_NAME'].map(self._completion_to_well)
+        # Map completion names to wells
+        well_name = self._map_completions(source['COMPLETION_LEGAL_NAME'], self._completion_to_well, dtype=well_dtype)
         
         # Drop rows where well_name is null (unknown completions)
-        inj_data = inj_data[inj_data['well_name'].notna()]
-        
-        # Extract year and month
-        inj_data['year'] = inj_data['Date'].dt.year
-        inj_data['month'] = inj_data['Date'].dt.month
-        
-        # Calculate daily rates
-        days_in_month = inj_data['Date'].dt.daysinmonth
-        inj_data['water_inj_rate'] = inj_data['Water_INJ_CALDAY'] / days_in_month
+        known = well_name.notna()
+        source = source.loc[known, ['Date', 'Water_INJ_CALDAY']]
+        
+        # Build the working frame: year, month and daily rate
+        year, month = self._year_month(source['Date'])
+        days_in_month = self._days_in_month(year, month)
+        inj_data = pd.DataFrame({
+            'well_name': well_name[known],
+            'year': year,
+            'month': month,
+            'water_inj_rate': source['Water_INJ_CALDAY'] / days_in_month
+        })
         
         # Group by well, year, month and sum rates
-        inj_monthly = inj_data.groupby(['well_name', 'year', 'month']).agg({
-            'water_inj_rate': 'sum'
-        }).reset_index()
+        inj_monthly = inj_data.groupby(['well_name', 'year', 'month'], sort=False, observed=True, as_index=False)[
+            'water_inj_rate'
+        ].sum()
         
         return inj_monthly
+    
+    @staticmethod
+    def _year_month(dates):
+        """
+        Year (int16) and month (int8) arrays of a datetime Series
+        (float with NaN where the date is missing)
+        """
+        if not (isinstance(dates.dtype, np.dtype) and dates.dtype.kind == 'M'):
+            # Timezone-aware or non-datetime columns go through the accessor
+            year = dates.dt.year.to_numpy()
+            month = dates.dt.month.to_numpy()
+            if year.dtype.kind == 'f':
+                return year, month
+            return year.astype(np.int16), month.astype(np.int8)
+        
+        # Months since 1970-01 straight from the datetime64 values
+        months = dates.to_numpy().astype('datetime64[M]').astype(np.int64)
+        year = (months // 12 + 1970).astype(np.int16)
+        month = (months % 12 + 1).astype(np.int8)
+        
+        missing = dates.isna().to_numpy()
+        if missing.any():
+            return np.where(missing, np.nan, year), np.where(missing, np.nan, month)
+        return year, month
+    
+    @classmethod
+    def _days_in_month(cls, year, month):
+        """Number of days of each year/month pair (NaN where the date is missing)"""
+        if month.dtype.kind == 'f':
+            # Missing dates (NaT) give float year/month arrays
+            days = np.full(len(month), np.nan)
+            valid = ~np.isnan(month)
+            days[valid] = cls._days_in_month(year[valid].astype(np.int64), month[valid].astype(np.int64))
+            return days
+        
+        leap = ((year % 4 == 0) & (year % 100 != 0)) | (year % 400 == 0)
+        return cls._DAYS_IN_MONTH[month - 1] + ((month == 2) & leap)
         
     def _calculate_historical_well_types(self, prod_monthly, inj_monthly):
         """
         Calculate historical well types - if a well ever had production or injection
         
-        Returns: Dictionary mapping well_name to {'has_production_history': bool, 'has_injection_history': bool}
+        Returns: DataFrame indexed by well_name with boolean columns
+                 has_production_history and has_injection_history
         """
-        # Initialize empty dictionary
-        historical_types = {}
-        
-        # Get all well names from both production and injection data
-        all_wells = set()
-        if not prod_monthly.empty:
-            all_wells.update(prod_monthly['well_name'].unique())
-        if not inj_monthly.empty:
-            all_wells.update(inj_monthly['well_name'].unique())
-        
-        # Initialize all wells with no history
-        for well in all_wells:
-            historical_types[well] = {
-                'has_production_history': False,
-                'has_injection_history': False
-            }
-        
-        # Mark wells with production history
+        # Positive cumulative production / injection per well
         if not prod_monthly.empty:
-            # Calculate total production for each well
-            prod_totals = prod_monthly.groupby('well_name').agg({
-                'oil_rate': 'sum',
-                'water_rate': 'sum'
-            })
-            
-            # Mark wells with production > 0
-            for well, row in prod_totals.iterrows():
-                if row['oil_rate'] > 0 or row['water_rate'] > 0:
-                    if well in historical_types:
-                        historical_types[well]['has_production_history'] = True
+            prod_totals = prod_monthly.groupby('well_name', sort=False, observed=True)[['oil_rate', 'water_rate']].sum()
+            has_production = (prod_totals['oil_rate'] > 0) | (prod_totals['water_rate'] > 0)
+        else:
+            has_production = pd.Series(dtype=bool)
         
-        # Mark wells with injection history
         if not inj_monthly.empty:
-            # Calculate total injection for each well
-            inj_totals = inj_monthly.groupby('well_name').agg({
-                'water_inj_rate': 'sum'
-            })
-            
-            # Mark wells with injection > 0
-            for well, row in inj_totals.iterrows():
-                if row['water_inj_rate'] > 0:
-                    if well in historical_types:
-                        historical_types[well]['has_injection_history'] = True
-        
-        return historical_types
+            has_injection = inj_monthly.groupby('well_name', sort=False, observed=True)['water_inj_rate'].sum() > 0
+        else:
+            has_injection = pd.Series(dtype=bool)
+        
+        # Align both flags on all wells; wells missing from a frame have no such history
+        all_wells = has_production.index.union(has_injection.index)
+        return pd.DataFrame({
+            'has_production_history': has_production.reindex(all_wells, fill_value=False).astype(bool),
+            'has_injection_history': has_injection.reindex(all_wells, fill_value=False).astype(bool)
+        }, index=all_wells)
     
     def _combine_and_classify_data(self, prod_monthly, inj_monthly, historical_well_types):
         """
@@ -225,115 +298,75 @@ class WellTypeCalculator:
             result['oil_rate'] = 0.0
             result['water_rate'] = 0.0
             result['well_type'] = 'INJECTION'
-            result['has_dual_function'] = 0
-            return result.sort_values(['well_name', 'year', 'month']).reset_index(drop=True)
+            result['has_dual_function'] = np.int8(0)
+            return result.sort_values(['well_name', 'year', 'month'], ignore_index=True)
             
         if inj_monthly.empty:
             result = prod_monthly.copy()
             result['water_inj_rate'] = 0.0
             result['well_type'] = 'PRODUCTION'
-            result['has_dual_function'] = 0
-            return result.sort_values(['well_name', 'year', 'month']).reset_index(drop=True)
+            result['has_dual_function'] = np.int8(0)
+            return result.sort_values(['well_name', 'year', 'month'], ignore_index=True)
         
-        # Merge production and injection data on well_name, year, month
-        merged = pd.merge(
-            prod_monthly, 
-            inj_monthly, 
-            on=['well_name', 'year', 'month'], 
-            how='outer'
-        )
+        # Stack production and injection rows on a common schema (zero-filled)
+        # and sum per well, year, month - equivalent to an outer merge + fillna
+        merged = pd.concat([
+            prod_monthly.assign(water_inj_rate=0.0),
+            inj_monthly.assign(oil_rate=0.0, water_rate=0.0)
+        ], ignore_index=True).groupby(['well_name', 'year', 'month'], sort=False, observed=True, as_index=False)[
+            ['oil_rate', 'water_rate', 'water_inj_rate']
+        ].sum()
         
-        # Fill NaN values with 0
-        merged.fillna({
-            'oil_rate': 0.0,
-            'water_rate': 0.0,
-            'water_inj_rate': 0.0
-        }, inplace=True)
+        # Sort chronologically per well once; everything below keeps this order
+        merged.sort_values(['well_name', 'year', 'month'], inplace=True, ignore_index=True)
         
         # Calculate has_prod and has_inj as boolean masks (current month)
-        has_current_prod = (merged['oil_rate'] > 0) | (merged['water_rate'] > 0)
-        has_current_inj = merged['water_inj_rate'] > 0
-        
-        # Initialize with default values
-        merged['well_type'] = 'UNKNOWN'
-        merged['has_dual_function'] = 0
-        
-        # CASE 1: Wells with both production and injection in the current month
-        # These are always DUAL regardless of history
-        merged.loc[has_current_prod & has_current_inj, 'well_type'] = 'DUAL'
-        merged.loc[has_current_prod & has_current_inj, 'has_dual_function'] = 1
-        
-        # CASE 2: Wells with only production in the current month
-        merged.loc[has_current_prod & ~has_current_inj, 'well_type'] = 'PRODUCTION'
-        
-        # CASE 3: Wells with only injection in the current month
-        merged.loc[~has_current_prod & has_current_inj, 'well_type'] = 'INJECTION'
+        has_current_prod = ((merged['oil_rate'] > 0) | (merged['water_rate'] > 0)).to_numpy()
+        has_current_inj = (merged['water_inj_rate'] > 0).to_numpy()
+        
+        # Classify every month in one pass over the well type codes
+        # CASE 1: Both production and injection in the current month -> DUAL (always, regardless of history)
+        # CASE 2: Only production in the current month -> PRODUCTION
+        # CASE 3: Only injection in the current month -> INJECTION
+        # Otherwise UNKNOWN until the history is applied below
+        is_dual = has_current_prod & has_current_inj
+        type_codes = np.where(is_dual, self._DUAL,
+                              np.where(has_current_prod, self._PRODUCTION,
+                                       np.where(has_current_inj, self._INJECTION, self._UNKNOWN)))
         
         # CASE 4: Wells with neither production nor injection in the current month
         # These need special handling based on history
-        no_current_data = ~has_current_prod & ~has_current_inj
+        no_current_data = type_codes == self._UNKNOWN
         
         if no_current_data.any():
-            # Process each well with chronological analysis
-            for well_name in merged.loc[no_current_data, 'well_name'].unique():
-                # Get all records for this well
-                well_data = merged[merged['well_name'] == well_name].copy()
-                
-                # Sort by year and month to establish chronological order
-                well_data = well_data.sort_values(['year', 'month'])
-                
-                # Reset index for proper sequential processing
-                well_data = well_data.reset_index(drop=True)
-                
-                # Initialize a variable to track the last known well type
-                last_known_type = None
-                
-                # First determine if this well has any history in the data
-                has_prod_history = (well_data['oil_rate'] > 0).any() or (well_data['water_rate'] > 0).any()
-                has_inj_history = (well_data['water_inj_rate'] > 0).any()
-                
-                # If no history in the data, check the historical_well_types
-                if not has_prod_history and not has_inj_history:
-                    if well_name in historical_well_types:
-                        history = historical_well_types[well_name]
-                        if history['has_production_history'] and not history['has_injection_history']:
-                            last_known_type = 'PRODUCTION'
-                        elif not history['has_production_history'] and history['has_injection_history']:
-                            last_known_type = 'INJECTION'
-                        elif history['has_production_history'] and history['has_injection_history']:
-                            # If has both types of history, use PRODUCTION as default
-                            last_known_type = 'PRODUCTION'
-                
-                # Now process each month in chronological order
-                for idx in range(len(well_data)):
-                    row = well_data.iloc[idx]
-                    
-                    # Check if this month has production or injection
-                    has_prod = row['oil_rate'] > 0 or row['water_rate'] > 0
-                    has_inj = row['water_inj_rate'] > 0
-                    
-                    if has_prod and has_inj:
-                        # Both production and injection - update last known type
-                        last_known_type = 'DUAL'
-                    elif has_prod:
-                        # Only production
-                        last_known_type = 'PRODUCTION'
-                    elif has_inj:
-                        # Only injection
-                        last_known_type = 'INJECTION'
-                    else:
-                        # No data this month - apply the last known type if we have one
-                        if last_known_type is not None:
-                            # Find this month in the original merged DataFrame
-                            mask = ((merged['well_name'] == well_name) & 
-                                    (merged['year'] == row['year']) & 
-                                    (merged['month'] == row['month']))
-                            
-                            # Update the well type in the merged DataFrame
-                            merged.loc[mask, 'well_type'] = last_known_type
-        
-        # Sort the results
-        result = merged.sort_values(['well_name', 'year', 'month']).reset_index(drop=True)
+            well_names = merged['well_name']
+            
+            # Carry the type of the last month with data forward over months without data
+            known_codes = pd.Series(np.where(no_current_data, np.nan, type_codes), index=merged.index)
+            last_known_code = known_codes.groupby(well_names, sort=False, observed=True).ffill()
+            
+            # Wells without any data fall back to their historical type, if any
+            has_data = pd.Series(~no_current_data, index=merged.index).groupby(well_names, sort=False, observed=True).any()
+            if not historical_well_types.empty:
+                default_code = pd.Series(
+                    np.where(historical_well_types['has_production_history'], self._PRODUCTION,
+                             np.where(historical_well_types['has_injection_history'], self._INJECTION, np.nan)),
+                    index=historical_well_types.index
+                )
+                default_code = default_code[~default_code.index.isin(has_data[has_data].index)]
+                last_known_code = last_known_code.fillna(well_names.map(default_code))
+            
+            # Months without data and no known type stay UNKNOWN
+            last_known_code = last_known_code.to_numpy()
+            fill_mask = no_current_data & ~np.isnan(last_known_code)
+            type_codes[fill_mask] = last_known_code[fill_mask]
+        
+        # Attach the classification columns once
+        merged['well_type'] = pd.Categorical.from_codes(type_codes, categories=self._WELL_TYPES)
+        merged['has_dual_function'] = is_dual.astype(np.int8)
+        
+        # Results are already sorted
+        result = merged
         
         # Add remarks
         result['remarks'] = ''
@@ -342,17 +375,18 @@ class WellTypeCalculator:
         dual_wells = result['has_dual_function'] == 1
         if dual_wells.any():
             # Just for dual wells - more efficient than running apply on all rows
-            dual_df = result[dual_wells].copy()
-            remarks = (
-                "Dual function well: Production rate = " + 
-                (dual_df['oil_rate'] + dual_df['water_rate']).round(2).astype(str) + 
-                " bbl/d, Injection rate = " + 
-                dual_df['water_inj_rate'].round(2).astype(str) + 
-                " bbl/d"
+            result.loc[dual_wells, 'remarks'] = self._format_remarks(
+                "Dual function well: Production rate = {} bbl/d, Injection rate = {} bbl/d",
+                (result['oil_rate'] + result['water_rate'])[dual_wells],
+                result['water_inj_rate'][dual_wells]
             )
-            result.loc[dual_wells, 'remarks'] = remarks.values
         
         return result
+    
+    @staticmethod
+    def _format_remarks(template, *rates):
+        """Format one remark per row from rate Series rounded to 2 decimals"""
+        return [template.format(*values) for values in zip(*(rate.round(2).tolist() for rate in rates))]
 
     def calculate_reservoir_well_types(self):
         """
@@ -426,55 +460,46 @@ class WellTypeCalculator:
         if 'primary_type' not in result.columns:
             result['primary_type'] = result['well_type']
         
+        # Dual function mask shared by the secondary type and remarks below
+        dual_mask = result['has_dual_function'] == 1
+        
         if 'secondary_type' not in result.columns:
             result['secondary_type'] = 'NONE'
             # Update secondary type for dual wells
-            dual_mask = result['has_dual_function'] == 1
             if dual_mask.any():
                 is_production_primary = result['well_type'] == 'PRODUCTION'
                 result.loc[dual_mask & is_production_primary, 'secondary_type'] = 'INJECTION'
                 result.loc[dual_mask & ~is_production_primary, 'secondary_type'] = 'PRODUCTION'
         
+        # Remarks computed upstream (see _combine_and_classify_data) are reused as is
         if 'remarks' not in result.columns:
             result['remarks'] = ''
             # Add remarks for different well types
-            dual_mask = result['has_dual_function'] == 1
             prod_mask = (result['well_type'] == 'PRODUCTION') & ~dual_mask
             inj_mask = (result['well_type'] == 'INJECTION') & ~dual_mask
             
             # Remarks for dual wells
             if dual_mask.any():
-                dual_df = result[dual_mask]
-                dual_remarks = (
-                    "Dual function well. Total production: " + 
-                    (dual_df['oil_rate'] + dual_df['water_rate']).round(2).astype(str) + 
-                    " bbl/d, Total injection: " + 
-                    dual_df['water_inj_rate'].round(2).astype(str) + 
-                    " bbl/d."
+                result.loc[dual_mask, 'remarks'] = self._format_remarks(
+                    "Dual function well. Total production: {} bbl/d, Total injection: {} bbl/d.",
+                    (result['oil_rate'] + result['water_rate'])[dual_mask],
+                    result['water_inj_rate'][dual_mask]
                 )
-                result.loc[dual_mask, 'remarks'] = dual_remarks.values
             
             # Remarks for production wells
             if prod_mask.any():
-                prod_df = result[prod_mask]
-                prod_remarks = (
-                    "Producing well. Oil rate: " + 
-                    prod_df['oil_rate'].round(2).astype(str) + 
-                    " bbl/d, Water rate: " + 
-                    prod_df['water_rate'].round(2).astype(str) + 
-                    " bbl/d."
+                result.loc[prod_mask, 'remarks'] = self._format_remarks(
+                    "Producing well. Oil rate: {} bbl/d, Water rate: {} bbl/d.",
+                    result['oil_rate'][prod_mask],
+                    result['water_rate'][prod_mask]
                 )
-                result.loc[prod_mask, 'remarks'] = prod_remarks.values
             
             # Remarks for injection wells
             if inj_mask.any():
-                inj_df = result[inj_mask]
-                inj_remarks = (
-                    "Injection well. Injection rate: " + 
-                    inj_df['water_inj_rate'].round(2).astype(str) + 
-                    " bbl/d."
+                result.loc[inj_mask, 'remarks'] = self._format_remarks(
+                    "Injection well. Injection rate: {} bbl/d.",
+                    result['water_inj_rate'][inj_mask]
                 )
-                result.loc[inj_mask, 'remarks'] = inj_remarks.values
         
         # Ensure we have all required columns and in the right order
         columns_to_keep = [
@@ -491,7 +516,7 @@ class WellTypeCalculator:
         result = result[columns_to_keep]
         
         # Sort the final result
-        return result.sort_values(['well_name', 'year', 'month']).reset_index(drop=True)
+        return result.sort_values(['well_name', 'year', 'month'], ignore_index=True)
     
     def calculate_completion_status(self):
         """
@@ -500,22 +525,31 @@ class WellTypeCalculator:
         Returns: DataFrame with columns well_name, completion_name, reservoir, year, month,
                 is_active, well_type, oil_rate, water_rate, water_inj_rate
         """
+        key_dtypes = self._key_dtypes()
+        
         self.progress_updated.emit(25, "Processing production data...")
         
         # Process production data at completion level (with progress updates)
-        prod_completion_data = self._process_completion_production_data()
+        prod_completion_data = self._process_completion_production_data(key_dtypes)
         
         self.progress_updated.emit(50, "Processing injection data...")
         
         # Process injection data at completion level (with progress updates)
-        inj_completion_data = self._process_completion_injection_data()
+        inj_completion_data = self._process_completion_injection_data(key_dtypes)
         
         self.progress_updated.emit(75, "Combining data and determining completion status...")
         
         # Combine data for each completion
-        return self._combine_completion_data(prod_completion_data, inj_completion_data)
+        result = self._combine_completion_data(prod_completion_data, inj_completion_data)
+        
+        # Return plain strings like the other result frames
+        categorical_columns = [col for col in ('well_name', 'completion_name', 'reservoir')
+                               if isinstance(result[col].dtype, pd.CategoricalDtype)]
+        if categorical_columns:
+            result = result.astype(dict.fromkeys(categorical_columns, object))
+        return result
 
-    def _process_completion_production_data(self):
+    def _process_completion_production_data(self, key_dtypes):
         """Process production data at completion level with optimized performance"""
         # Get production data
         prod_data = self.data_store.production_data.data
@@ -523,67 +557,43 @@ class WellTypeCalculator:
         if prod_data is None or prod_data.empty:
             return pd.DataFrame(columns=['completion_name', 'well_name', 'reservoir', 'year', 'month', 'oil_rate', 'water_rate'])
         
-        # Make a copy to avoid modifying the original
-        prod_data = prod_data.copy()
-        
-        # For performance, only process the minimum required columns
-        keep_cols = ['COMP_S_NAME', 'PROD_DT', 'VO_OIL_PROD', 'VO_WAT_PROD']
-        prod_data = prod_data[keep_cols]
-        
-        # Add well_name column based on completion name
-        # Use a more efficient vectorized mapping
-        completion_to_well = {}
-        for well_name, completions in self.data_store.well_to_completions.items():
-            for completion in completions:
-                completion_to_well[completion] = well_name
-                
-        prod_data['well_name'] = prod_data['COMP_S_NAME'].map(completion_to_well)
+        # Map completion names to wells (mapping built once in __init__)
+        well_name = self._map_completions(prod_data['COMP_S_NAME'], self._completion_to_well, dtype=key_dtypes['well_name'])
         
         # Drop rows with unknown completions immediately to reduce data size
-        prod_data = prod_data.dropna(subset=['well_name'])
-        
-        if prod_data.empty:
+        known = well_name.notna()
+        if not known.any():
             return pd.DataFrame(columns=['completion_name', 'well_name', 'reservoir', 'year', 'month', 'oil_rate', 'water_rate'])
         
-        # Add reservoir column based on completion name
-        completion_to_reservoir = self.data_store.completion_to_reservoir
-        prod_data['reservoir'] = prod_data['COMP_S_NAME'].map(
-            lambda comp: completion_to_reservoir.get(comp, 'UNKNOWN')
-        )
-        
-        # Extract year and month more efficiently
-        prod_data['year'] = prod_data['PROD_DT'].dt.year
-        prod_data['month'] = prod_data['PROD_DT'].dt.month
-        
-        # Calculate daily rates
-        prod_data['days_in_month'] = prod_data['PROD_DT'].dt.daysinmonth
-        prod_data['oil_rate'] = prod_data['VO_OIL_PROD'] / prod_data['days_in_month']
-        prod_data['water_rate'] = prod_data['VO_WAT_PROD'] / prod_data['days_in_month']
-        
-        # Rename completion column for consistency
-        prod_data.rename(columns={'COMP_S_NAME': 'completion_name'}, inplace=True)
-        
-        # Process in chunks for better memory management
-        chunk_size = 10000
-        chunks = [prod_data[i:i+chunk_size] for i in range(0, len(prod_data), chunk_size)]
-        
-        result_chunks = []
-        for chunk in chunks:
-            # Group by completion, well, reservoir, year, month and sum rates
-            grouped = chunk.groupby(['completion_name', 'well_name', 'reservoir', 'year', 'month']).agg({
-                'oil_rate': 'sum',
-                'water_rate': 'sum'
-            }).reset_index()
-            
-            result_chunks.append(grouped)
+        # Only the columns used below are read (no full-frame copy)
+        source = prod_data.loc[known, ['COMP_S_NAME', 'PROD_DT', 'VO_OIL_PROD', 'VO_WAT_PROD']]
         
-        # Combine the processed chunks
-        if result_chunks:
-            return pd.concat(result_chunks, ignore_index=True)
-        else:
-            return pd.DataFrame(columns=['completion_name', 'well_name', 'reservoir', 'year', 'month', 'oil_rate', 'water_rate'])
+        # Add reservoir column based on completion name
+        reservoir = self._map_completions(source['COMP_S_NAME'], self.data_store.completion_to_reservoir, 'UNKNOWN',
+                                          dtype=key_dtypes['reservoir'])
+        
+        # Extract year and month, then calculate daily rates
+        year, month = self._year_month(source['PROD_DT'])
+        days_in_month = self._days_in_month(year, month)
+        completion_data = pd.DataFrame({
+            'completion_name': pd.Categorical(source['COMP_S_NAME'], dtype=key_dtypes['completion_name']),
+            'well_name': well_name[known],
+            'reservoir': reservoir,
+            'year': year,
+            'month': month,
+            'oil_rate': source['VO_OIL_PROD'] / days_in_month,
+            'water_rate': source['VO_WAT_PROD'] / days_in_month
+        })
+        
+        # Group by completion, well, reservoir, year, month and sum rates
+        # (a single groupby - per-chunk groupbys left duplicate groups across chunk boundaries)
+        prod_completion = completion_data.groupby(['completion_name', 'well_name', 'reservoir', 'year', 'month'], sort=False, observed=True, as_index=False)[
+            ['oil_rate', 'water_rate']
+        ].sum()
+        
+        return prod_completion
 
-    def _process_completion_injection_data(self):
+    def _process_completion_injection_data(self, key_dtypes):
         """Process injection data at completion level with optimized performance"""
         # Get injection data
         inj_data = self.data_store.injection_data.data
@@ -591,63 +601,40 @@ class WellTypeCalculator:
         if inj_data is None or inj_data.empty:
             return pd.DataFrame(columns=['completion_name', 'well_name', 'reservoir', 'year', 'month', 'water_inj_rate'])
         
-        # Make a copy to avoid modifying the original
-        inj_data = inj_data.copy()
-        
-        # For performance, only process the minimum required columns
-        keep_cols = ['COMPLETION_LEGAL_NAME', 'Date', 'Water_INJ_CALDAY']
-        inj_data = inj_data[keep_cols]
-        
-        # Add well_name column based on completion name
-        # Use a more efficient vectorized mapping
-        completion_to_well = {}
-        for well_name, completions in self.data_store.well_to_completions.items():
-            for completion in completions:
-                completion_to_well[completion] = well_name
-                
-        inj_data['well_name'] = inj_data['COMPLETION_LEGAL_NAME'].map(completion_to_well)
+        # Map completion names to wells (mapping built once in __init__)
+        well_name = self._map_completions(inj_data['COMPLETION_LEGAL_NAME'], self._completion_to_well, dtype=key_dtypes['well_name'])
         
         # Drop rows with unknown completions immediately to reduce data size
-        inj_data = inj_data.dropna(subset=['well_name'])
-        
-        if inj_data.empty:
+        known = well_name.notna()
+        if not known.any():
             return pd.DataFrame(columns=['completion_name', 'well_name', 'reservoir', 'year', 'month', 'water_inj_rate'])
         
-        # Add reservoir column based on completion name
-        completion_to_reservoir = self.data_store.completion_to_reservoir
-        inj_data['reservoir'] = inj_data['COMPLETION_LEGAL_NAME'].map(
-            lambda comp: completion_to_reservoir.get(comp, 'UNKNOWN')
-        )
-        
-        # Extract year and month more efficiently
-        inj_data['year'] = inj_data['Date'].dt.year
-        inj_data['month'] = inj_data['Date'].dt.month
-        
-        # Calculate daily rates
-        inj_data['days_in_month'] = inj_data['Date'].dt.daysinmonth
-        inj_data['water_inj_rate'] = inj_data['Water_INJ_CALDAY'] / inj_data['days_in_month']
-        
-        # Rename completion column for consistency
-        inj_data.rename(columns={'COMPLETION_LEGAL_NAME': 'completion_name'}, inplace=True)
-        
-        # Process in chunks for better memory management
-        chunk_size = 10000
-        chunks = [inj_data[i:i+chunk_size] for i in range(0, len(inj_data), chunk_size)]
+        # Only the columns used below are read (no full-frame copy)
+        source = inj_data.loc[known, ['COMPLETION_LEGAL_NAME', 'Date', 'Water_INJ_CALDAY']]
         
-        result_chunks = []
-        for chunk in chunks:
-            # Group by completion, well, reservoir, year, month and sum rates
-            grouped = chunk.groupby(['completion_name', 'well_name', 'reservoir', 'year', 'month']).agg({
-                'water_inj_rate': 'sum'
-            }).reset_index()
-            
-            result_chunks.append(grouped)
-        
-        # Combine the processed chunks
-        if result_chunks:
-            return pd.concat(result_chunks, ignore_index=True)
-        else:
-            return pd.DataFrame(columns=['completion_name', 'well_name', 'reservoir', 'year', 'month', 'water_inj_rate'])
+        # Add reservoir column based on completion name
+        reservoir = self._map_completions(source['COMPLETION_LEGAL_NAME'], self.data_store.completion_to_reservoir, 'UNKNOWN',
+                                          dtype=key_dtypes['reservoir'])
+        
+        # Extract year and month, then calculate daily rates
+        year, month = self._year_month(source['Date'])
+        days_in_month = self._days_in_month(year, month)
+        completion_data = pd.DataFrame({
+            'completion_name': pd.Categorical(source['COMPLETION_LEGAL_NAME'], dtype=key_dtypes['completion_name']),
+            'well_name': well_name[known],
+            'reservoir': reservoir,
+            'year': year,
+            'month': month,
+            'water_inj_rate': source['Water_INJ_CALDAY'] / days_in_month
+        })
+        
+        # Group by completion, well, reservoir, year, month and sum rates
+        # (a single groupby - per-chunk groupbys left duplicate groups across chunk boundaries)
+        inj_completion = completion_data.groupby(['completion_name', 'well_name', 'reservoir', 'year', 'month'], sort=False, observed=True, as_index=False)[
+            'water_inj_rate'
+        ].sum()
+        
+        return inj_completion
 
     def _combine_completion_data(self, prod_monthly, inj_monthly):
         """
@@ -662,109 +649,61 @@ class WellTypeCalculator:
             ])
             
         # If one is empty but not the other
+        # (the missing columns are built as one frame and attached in a single concat)
         if prod_monthly is None or prod_monthly.empty:
-            result = inj_monthly.copy()
-            result['oil_rate'] = 0.0
-            result['water_rate'] = 0.0
-            result['well_type'] = 'INJECTION'
-            result['is_active'] = result['water_inj_rate'] > 0
-            result['is_active'] = result['is_active'].astype(int)
-            return result.sort_values(['well_name', 'completion_name', 'year', 'month']).reset_index(drop=True)
+            added = pd.DataFrame({
+                'oil_rate': 0.0,
+                'water_rate': 0.0,
+                'well_type': 'INJECTION',
+                'is_active': (inj_monthly['water_inj_rate'] > 0).astype(np.int8)
+            }, index=inj_monthly.index)
+            result = pd.concat([inj_monthly, added], axis=1)
+            return result.sort_values(['well_name', 'completion_name', 'year', 'month'], ignore_index=True)
             
         if inj_monthly is None or inj_monthly.empty:
-            result = prod_monthly.copy()
-            result['water_inj_rate'] = 0.0
-            result['well_type'] = 'PRODUCTION'
-            result['is_active'] = (result['oil_rate'] > 0) | (result['water_rate'] > 0)
-            result['is_active'] = result['is_active'].astype(int)
-            return result.sort_values(['well_name', 'completion_name', 'year', 'month']).reset_index(drop=True)
-        
-        # Performance optimization - use efficient merge with suffixes
-        try:
-            # Merge in chunks to avoid memory issues
-            chunk_size = 10000
-            prod_chunks = [prod_monthly[i:i+chunk_size] for i in range(0, len(prod_monthly), chunk_size)]
-            
-            merged_chunks = []
-            for prod_chunk in prod_chunks:
-                # Merge production and injection data on completion_name, well_name, reservoir, year, month
-                chunk_merged = pd.merge(
-                    prod_chunk, 
-                    inj_monthly, 
-                    on=['completion_name', 'well_name', 'reservoir', 'year', 'month'], 
-                    how='outer',
-                    suffixes=('', '_inj')
-                )
-                merged_chunks.append(chunk_merged)
-            
-            if merged_chunks:
-                merged = pd.concat(merged_chunks, ignore_index=True)
-            else:
-                # Fallback if chunking failed
-                merged = pd.merge(
-                    prod_monthly, 
-                    inj_monthly, 
-                    on=['completion_name', 'well_name', 'reservoir', 'year', 'month'], 
-                    how='outer'
-                )
-        except Exception as e:
-            print(f"Error during merge: {e}")
-            # Try a different merge approach if the first one fails
-            merged = pd.merge(
-                prod_monthly, 
-                inj_monthly, 
-                on=['completion_name', 'well_name', 'reservoir', 'year', 'month'], 
-                how='outer'
-            )
+            added = pd.DataFrame({
+                'water_inj_rate': 0.0,
+                'well_type': 'PRODUCTION',
+                'is_active': ((prod_monthly['oil_rate'] > 0) | (prod_monthly['water_rate'] > 0)).astype(np.int8)
+            }, index=prod_monthly.index)
+            result = pd.concat([prod_monthly, added], axis=1)
+            return result.sort_values(['well_name', 'completion_name', 'year', 'month'], ignore_index=True)
+        
+        # Merge production and injection data on well_name, completion_name, reservoir, year, month;
+        # each completion has a single reservoir, so the sorted join keys already give the result order
+        merged = pd.merge(
+            prod_monthly, 
+            inj_monthly, 
+            on=['well_name', 'completion_name', 'reservoir', 'year', 'month'], 
+            how='outer',
+            sort=True,
+            suffixes=('', '_inj')
+        )
         
-        # Fill NaN values with 0
+        # Fill NaN rates with 0 in place (merged is a fresh frame, no need to copy it)
         fill_cols = {'oil_rate': 0.0, 'water_rate': 0.0, 'water_inj_rate': 0.0}
-        merged = merged.fillna(fill_cols)
+        merged.fillna(fill_cols, inplace=True)
         
         # Determine well type and active status
-        # Calculate has_prod and has_inj as boolean masks
-        has_prod = (merged['oil_rate'] > 0) | (merged['water_rate'] > 0)
-        has_inj = merged['water_inj_rate'] > 0
-        
-        # Set well_type based on production and injection
-        merged['well_type'] = 'UNKNOWN'
-        merged.loc[has_prod & ~has_inj, 'well_type'] = 'PRODUCTION'
-        merged.loc[~has_prod & has_inj, 'well_type'] = 'INJECTION'
-        merged.loc[has_prod & has_inj, 'well_type'] = 'DUAL'
-        
-        # Reclassify DUAL as either PRODUCTION or INJECTION based on dominant rate
-        dual_mask = merged['well_type'] == 'DUAL'
-        if dual_mask.any():
-            # Process dual wells in chunks to avoid performance issues
-            dual_wells = merged[dual_mask].copy()
-            
-            dual_chunks = [dual_wells[i:i+1000] for i in range(0, len(dual_wells), 1000)]
-            for i, chunk in enumerate(dual_chunks):
-                chunk_mask = chunk.index
-                merged.loc[chunk_mask, 'well_type'] = chunk.apply(
-                    lambda row: 'PRODUCTION' if (row['oil_rate'] + row['water_rate'] >= row['water_inj_rate']) 
-                            else 'INJECTION', 
-                    axis=1
-                )
+        # Pack production (1) and injection (2) activity flags into one byte per row
+        oil_rate = merged['oil_rate'].to_numpy()
+        water_rate = merged['water_rate'].to_numpy()
+        water_inj_rate = merged['water_inj_rate'].to_numpy()
+        has_prod = (oil_rate > 0) | (water_rate > 0)
+        has_inj = water_inj_rate > 0
+        activity = has_prod.view(np.uint8) | (has_inj.view(np.uint8) << 1)
+        
+        # Look up the well type code of each activity value; DUAL months are
+        # reclassified as PRODUCTION or INJECTION by dominant rate
+        activity_codes = np.array([self._UNKNOWN, self._PRODUCTION, self._INJECTION, self._DUAL], dtype=np.int8)
+        type_codes = activity_codes[activity]
+        dual = activity == 3
+        type_codes[dual] = np.where(oil_rate[dual] + water_rate[dual] >= water_inj_rate[dual],
+                                    self._PRODUCTION, self._INJECTION)
+        
+        # Return plain strings like the other result frames
+        merged['well_type'] = np.array(self._WELL_TYPES, dtype=object)[type_codes]
         
         # Set is_active based on whether there's any production or injection
-        merged['is_active'] = (has_prod | has_inj).astype(int)
-        
-        # Sort results
-        # Use sorted chunks to avoid memory issues with very large dataframes
-        try:
-            chunk_size = 10000
-            result_chunks = [merged[i:i+chunk_size] for i in range(0, len(merged), chunk_size)]
-            
-            sorted_chunks = []
-            for chunk in result_chunks:
-                sorted_chunk = chunk.sort_values(['well_name', 'completion_name', 'year', 'month'])
-                sorted_chunks.append(sorted_chunk)
-            
-            result = pd.concat(sorted_chunks, ignore_index=True)
-        except Exception as e:
-            print(f"Error during sorting: {e}")
-            # Fallback if chunking fails
-            result = merged
-        
-        return result
\ No newline at end of file
+        merged['is_active'] = (activity != 0).astype(np.int8)
+        return merged
\ No newline at end of file